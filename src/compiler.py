@@ -0,0 +1,137 @@
+"""Compilation of purely numeric expressions into native Python functions."""
+
+
+
+from functools import partial
+
+import config as cf
+import evaluate as ev
+import keywords as kw
+import datatypes as dt
+
+
+
+##### Collections #####
+
+
+
+# Errors raised when an expression is nested too deeply to be translated or compiled by Python
+LIMITS = (SyntaxError, RecursionError, MemoryError)
+
+# Numeric keywords eligible for compilation, with the number of arguments they take
+NUMERIC = {
+    "+"  : 2,   "-"  : 2,   "*"  : 2,   "/"  : 2,
+    "**" : 2,   "//" : 2,   "%"  : 2,   "++" : 1,
+    "<"  : 2,   ">"  : 2,   "<=" : 2,   ">=" : 2,
+    "==" : 2,   "!=" : 2,   "eq" : 2,
+}
+
+
+
+##### Compilation #####
+
+
+
+def fingerprint(expr: any) -> tuple:
+    """Structural key for an expression; atoms are tagged with their type so that e.g. `1`, `1.0` and `#t` stay distinct."""
+    return tuple(fingerprint(e) for e in expr) if isinstance(expr, list) else (type(expr), expr)
+
+
+def translate(expr: any, namespace: dict, parameters: dict = None, name: str = None) -> str | None:
+    """Translate a numeric expression into Python source, collecting the objects it refers to in `namespace`.
+    \nWhen compiling a function, `parameters` maps its parameters to Python names and `name` allows recursive calls.
+    \nReturns None if any part of the expression requires the full evaluator."""
+
+    # Literal numbers and booleans are passed through as constants
+    if isinstance(expr, (int, float)):
+        constant = f"c{len(namespace)}"
+        namespace[constant] = expr
+        return constant
+
+    # Function parameters are local; other variables are looked up in the environment at runtime, but only outside functions
+    elif kw.isatom(expr):
+        if not (isinstance(expr, str) and kw.isvariable(expr)): return None
+        elif parameters is None: return f"lookup({expr!r})"
+        return parameters.get(expr)
+
+    elif not expr or not isinstance(expr[0], str): return None
+
+    HEAD, TAIL = expr[0], expr[1:]
+    category, function = cf.config.DISPATCH.get(HEAD, (None, None))
+
+    # Conditionals become nested conditional expressions, evaluated lazily just like cond()
+    if HEAD == "cond" and category == "SPECIAL":
+        if not all(isinstance(clause, list) and len(clause) > 1 for clause in TAIL): return None
+
+        source = "None"
+        for clause in reversed(TAIL):
+            body = translate(clause[1], namespace, parameters, name)
+            condition = "True" if clause[0] == "else" else translate(clause[0], namespace, parameters, name)
+            if None in (body, condition): return None
+            source = f"({body} if {condition} else {source})"
+
+        return source
+
+    args = [translate(arg, namespace, parameters, name) for arg in TAIL]
+    if None in args: return None
+
+    # Recursive calls look the function up by name at runtime, in case it has been redefined
+    if HEAD == name and kw.isvariable(HEAD) and not kw.isimport(HEAD) and HEAD not in parameters:
+        return f"invoke(lookup({HEAD!r}), [{", ".join(args)}])"
+
+    # Otherwise only calls to built-in numeric functions with the correct number of arguments qualify
+    elif category != "REGULAR" or NUMERIC.get(HEAD) != len(args): return None
+
+    reference = f"f{len(namespace)}"
+    namespace[reference] = function
+
+    return f"{reference}({", ".join(args)})"
+
+
+def invoke(function: any, args: list) -> any:
+    """Call a function from compiled code with already evaluated arguments."""
+
+    if isinstance(function, dt.Function): return function.call(args)
+
+    # Anything else goes through the evaluator, quoting the arguments so they are not evaluated twice
+    return ev.evaluate([function, *(["quote", arg] for arg in args)])
+
+
+def compile_function(function: "dt.Function") -> callable:
+    """Compile a purely numeric function, including self-recursive calls, to native Python.
+    \nReturns None if the function requires the full evaluator or cannot be compiled for any other reason."""
+
+    # Repeated parameters shadow one another, which the compiled function cannot reproduce
+    if len(set(function.parameters)) != len(function.parameters): return None
+
+    namespace = { "lookup" : cf.config.ENV.lookup, "invoke" : invoke }
+    parameters = { parameter : f"a{i}" for i, parameter in enumerate(function.parameters) }
+
+    # Compilation is only an optimization, so any failure leaves the function to the evaluator
+    try:
+        source = translate(function.body, namespace, parameters, function.name)
+        return source and eval(f"lambda {", ".join(parameters.values())}: {source}", namespace)
+
+    except Exception: return None
+
+
+def compiled(expr: any) -> callable:
+    """Return a function of no arguments which evaluates `expr`.
+    \nPurely numeric expressions are compiled to native Python once and cached by structure; anything else falls back to the evaluator."""
+
+    try:
+        key = fingerprint(expr)
+
+        if key in cf.config.COMPILED: function = cf.config.COMPILED[key]
+        else:
+            namespace = { "lookup" : cf.config.ENV.lookup }
+            source = translate(expr, namespace)
+            function = source and eval(f"lambda: {source}", namespace)
+
+            # Failures are cached as None too, so they are not retried
+            if len(cf.config.COMPILED) < cf.config.COMPILED_SIZE: cf.config.COMPILED[key] = function
+
+    # Expressions too deep for Python's parser are left to the evaluator, which has no such limit
+    except LIMITS: function = None
+
+    return function or partial(ev.evaluate, expr)
@@ -23,6 +23,12 @@ class Config:
         self.NAME = "ΩPAL"
         self.PATH = os.path.abspath(__file__ + "/../..")
 
+        # Number of calls after which a function is compiled, if possible
+        self.JIT_THRESHOLD = 10
+
+        # Maximum number of compiled expressions kept at once
+        self.COMPILED_SIZE = 2**10
+
         # Color customization
         self.COLORS = {
             "red"        : '\033[0;31m',
@@ -113,6 +119,9 @@ class Config:
                             },
             "EXTENSIONS"  : {}
         }
+
+        # Build the keyword set and dispatch table before anything is evaluated
+        self.refresh_keywords()
         
         # Load extensions
         intrp.interpreter.extend(self.ORIGINAL_EXTENSIONS, False)
@@ -126,6 +135,26 @@ class Config:
         return f"{self.COLORS[color or self.DEFAULT_COLOR]}{text}{self.COLORS["end"]}"
     
     
+    def refresh_keywords(self) -> None:
+        """Rebuild the flattened keyword set and dispatch table; must be called whenever a keyword category changes."""
+
+        self.KEYWORD_SET = frozenset().union(*self.KEYWORDS.values())
+
+        # Map each keyword to its category and function (None for special forms); categories are merged in reverse
+        # so the first category declaring a keyword takes precedence, except that special forms are only reached
+        # once every other category has been tried and are therefore merged first
+        categories = sorted(reversed(self.KEYWORDS.items()), key=lambda item: item[0] != "SPECIAL")
+        self.DISPATCH = {
+            keyword : (name, category.get(keyword) if isinstance(category, dict) else None)
+            for name, category in categories
+            for keyword in category
+        }
+
+        # Compiled numeric expressions and functions refer to the dispatch table, so discard them
+        self.COMPILED = {}
+        self.COMPILED_FUNCTIONS = {}
+
+
     def current_keyword_num(self) -> int:
         """Return current total number of keywords in the language."""
         return sum(len(category) for category in self.KEYWORDS.values())
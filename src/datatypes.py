@@ -2,12 +2,13 @@
 
 
 
-import random
+import itertools
 
 import config as cf
 import parser as prs
 import evaluate as ev
 import keywords as kw
+import compiler as cp
 import environment as env
 
 
@@ -15,6 +16,9 @@ import environment as env
 class Closable:
     """Parent class for all OPAL structures supporting closures, i.e. functions and templates (classes)."""
 
+    # Source of unique identifiers shared by all closables
+    ids = itertools.count()
+
     def __init__(self, name: str, parameters: list = None, body: list = None) -> None:
         """Initialize datatype and generate unique ID."""
 
@@ -28,9 +32,9 @@ class Closable:
         cf.config.CLOSURES[self.id] = env.Environment()
 
 
-    def generate_id(self, k: int = 15) -> str: 
-        """Generate a randomized identification string between 0 and k digits long."""
-        return f"ID:{random.randint(0, 10**k)}.{self.type}.{self.name}"
+    def generate_id(self) -> int: 
+        """Generate a unique integer identifier, used to key the closure environments."""
+        return next(Closable.ids)
     
 
     def __str__(self) -> str: return f"<{self.type} {self.name}>"
@@ -49,39 +53,60 @@ class Function(Closable):
             
         if self.type == "lambda": self.name = f"{prs.convert(self.parameters)} {prs.convert(self.body)}" 
 
+        # Number of calls, used to decide when to compile the function; compiled functions
+        # bypass the environment, so only named functions without a captured closure qualify
+        self.calls = 0
+        self.compilable = self.type == "function"
+
 
     def eval(self, args: list) -> any:
         """Function call evaluation."""
 
+        # Applicative order evaluation for arguments
+        args = kw.evlist(args) if args is not None else []
+
+        return self.call(args)
+
+
+    def call(self, args: list) -> any:
+        """Call the function with already evaluated arguments."""
+
         def logic(args: list) -> any:
             """Function evaluation logic."""
 
+            # Bind frequently accessed globals once per call
+            closure, environment = cf.config.CLOSURES[self.id], cf.config.ENV
+            isLambda = self.type in ('lambda', 'self')
+
             # Match the arguments to the function to its parameters
-            cf.config.CLOSURES[self.id].match_arguments(self.parameters, args)
+            closure.match_arguments(self.parameters, args)
 
             # Define 'self' as a special local reference to the current function
-            self.type in ('lambda', 'self') and cf.config.CLOSURES[self.id].define('self', self.parameters, self.body)
+            isLambda and closure.define('self', self.parameters, self.body)
 
-            cf.config.ENV.extend(cf.config.CLOSURES[self.id])
+            environment.extend(closure)
 
             try:
                 value = ev.evaluate(self.body)
 
                 # If returning a function, give it access to current closure
-                if isinstance(value, Function): cf.config.CLOSURES[value.id] = cf.config.CLOSURES[self.id].clone()
+                if type(value) is Function: cf.config.CLOSURES[value.id] = closure.clone(); value.compilable = False
 
             finally:
-                cf.config.ENV.end_scope(len(cf.config.CLOSURES[self.id]))
-                self.type in ('lambda', 'self') and cf.config.CLOSURES[self.id].delete('self')
+                environment.end_scope(len(closure))
+                isLambda and closure.delete('self')
 
             return value
-        
-        # Applicative order evaluation for arguments
-        args = [] if args == None else kw.evlist(args)
 
         # Confirm function arity
         if len(self.parameters) != len(args): 
             raise TypeError(f"{self.name} takes {len(self.parameters)} argument{"s"*bool(len(self.parameters)-1)} but {len(args)} were given")
+
+        # Once a function is called often enough, try compiling it; None marks functions that cannot be compiled
+        self.calls += 1
+        if self.compilable and self.calls >= cf.config.JIT_THRESHOLD:
+            if self.id not in cf.config.COMPILED_FUNCTIONS: cf.config.COMPILED_FUNCTIONS[self.id] = cp.compile_function(self)
+            if cf.config.COMPILED_FUNCTIONS[self.id]: return cf.config.COMPILED_FUNCTIONS[self.id](*args)
         
         # Execute the actual function logic in local scope
         return cf.config.CLOSURES[self.id].runlocal(logic, args)
@@ -153,3 +178,32 @@ class Instance(Closable):
             return cf.config.ENV.lookup(method).eval(args)
         
         return cf.config.ENV.runClosed(cf.config.CLOSURES[self.id], logic, method, args)
+
+
+
+class BinaryCall(list):
+    """Expression calling a regular function with two arguments, tagged by the parser with the function's dispatch entry.
+    \nBehaves as an ordinary list everywhere else, so quoting, printing and list operations are unaffected."""
+
+    __slots__ = ("entry",)
+
+    def __init__(self, expr: list, entry: tuple) -> None:
+        super().__init__(expr)
+        self.entry = entry
+
+
+
+class Keyword(str):
+    """Keyword atom, tagged by the parser with the keyword's dispatch entry.
+    \nCompares, hashes and prints exactly like the underlying string."""
+
+    def __new__(cls, name: str, entry: tuple = None) -> "Keyword":
+        keyword = super().__new__(cls, name)
+        keyword.entry = entry
+        return keyword
+
+
+    # Keywords are immutable, and copying the entry would also copy the environment its functions are bound to
+    def __copy__(self) -> "Keyword": return self
+
+    def __deepcopy__(self, memo: dict) -> "Keyword": return self
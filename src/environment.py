@@ -112,6 +112,7 @@ class Environment:
 
             cf.config.EXTENSION_LOG.remove(extension)
             cf.config.KEYWORDS["EXTENSIONS"].pop(extension)
+            cf.config.refresh_keywords()
 
         else: raise NameError(f"extension '{extension}' not found.")
 
@@ -168,8 +169,10 @@ class Environment:
     def cleanup(self, var: str, scope: int = 0) -> None:
         """Basic garbage collection for the closure environments attached to functions."""
 
-        # Get the current variable; if it is a closable, remove its closure
-        current = self.env[scope].get(var, None); isinstance(current, dt.Closable) and cf.config.CLOSURES.pop(current.id) 
+        # Get the current variable; if it is a closable, remove its closure and any compiled version of it
+        current = self.env[scope].get(var, None)
+
+        if isinstance(current, dt.Closable): cf.config.CLOSURES.pop(current.id); cf.config.COMPILED_FUNCTIONS.pop(current.id, None)
 
 
     def __len__(self) -> int: return len(self.env)
@@ -15,10 +15,17 @@ import datatypes as dt
 def evaluate(expr):
     """Evaluates complete OPAL expressions."""
 
+    # Binary calls resolved by the parser skip dispatch, as long as their head is unchanged and the keyword table has not changed since
+    if type(expr) is dt.BinaryCall and type(expr[0]) is dt.Keyword and expr[0].entry is expr.entry and cf.config.DISPATCH.get(expr[0]) is expr.entry:
+        return expr.entry[1](evaluate(expr[1]), evaluate(expr[2]))
+
     # Processing a single atom
 
+    # Numbers, booleans and tagged keywords from the parser evaluate to themselves without further classification
+    if type(expr) in (int, float, bool) or (type(expr) is dt.Keyword and cf.config.DISPATCH.get(expr) is expr.entry): return expr
+
     # Look up variables in environment, otherwise return as literal
-    if kw.isatom(expr): return cf.config.ENV.lookup(expr) if kw.isvariable(expr) else kw.rebool(expr) if kw.isbool(expr) else expr
+    elif kw.isatom(expr): return cf.config.ENV.lookup(expr) if kw.isvariable(expr) else kw.rebool(expr) if kw.isbool(expr) else expr
 
     # Otherwise processing a list
 
@@ -31,8 +38,11 @@ def evaluate(expr):
         # Head and tail identifiers for readability
         HEAD, TAIL = expr[0],  expr[1:]
 
+        # Keywords tagged by the parser skip the checks below while their dispatch entry is current
+        if type(HEAD) is dt.Keyword and cf.config.DISPATCH.get(HEAD) is HEAD.entry: NAME, FUNCTION = HEAD.entry
+
         # Evaluate methods from imported modules
-        if kw.isimport(HEAD): return kw.run_method(HEAD, TAIL)
+        elif kw.isimport(HEAD): return kw.run_method(HEAD, TAIL)
 
         # Evaluate function calls
         elif kw.isfunction(HEAD): return HEAD.eval(TAIL)
@@ -43,54 +53,54 @@ def evaluate(expr):
         # If the head is a variable, replace it with its value and re-evaluate the expression
         elif kw.isvariable(HEAD): return evaluate([cf.config.ENV.lookup(HEAD), *TAIL])
 
-        # If its a keyword, evaluate each group
-        elif kw.iskeyword(HEAD):
-            for NAME, CATEGORY in cf.config.KEYWORDS.items():
-                if HEAD in CATEGORY:
-                    match NAME:
+        # Single lookup for the keyword's category and function
+        elif kw.iskeyword(HEAD): NAME, FUNCTION = cf.config.DISPATCH.get(HEAD, (None, None))
+
+        # Otherwise head is a literal
+        else: return kw.evlist(expr)
 
-                        # Regular or applicative-order n-ary functions
-                        case "REGULAR": return CATEGORY[HEAD](*kw.evlist(TAIL))
+        # Evaluate each group of keywords
+        match NAME:
 
-                        # Irregular or normal-order n-ary functions
-                        case "IRREGULAR": return CATEGORY[HEAD](*TAIL)
+            # Regular or applicative-order n-ary functions
+            case "REGULAR": return FUNCTION(*kw.evlist(TAIL))
 
-                        # Environment manipulation functions
-                        case "ENVIRONMENT": return CATEGORY[HEAD](*TAIL)
+            # Irregular or normal-order n-ary functions
+            case "IRREGULAR": return FUNCTION(*TAIL)
 
-                        # Boolean functions
-                        case "BOOLEAN": return CATEGORY[HEAD](*[bool(arg) for arg in kw.evlist(TAIL)])
+            # Environment manipulation functions
+            case "ENVIRONMENT": return FUNCTION(*TAIL)
 
-                        # Extensions
-                        case "EXTENSIONS": return CATEGORY[HEAD](*TAIL)
+            # Boolean functions
+            case "BOOLEAN": return FUNCTION(*[bool(arg) for arg in kw.evlist(TAIL)])
 
-            # 'cxr' expressions
-            if kw.iscxr(HEAD): return kw.evcxr(HEAD[1:-1], evaluate(expr[1]))
+            # Extensions
+            case "EXTENSIONS": return FUNCTION(*TAIL)
 
-            # Special forms and functions with unique evaluation requirements
-            match HEAD:
+        # 'cxr' expressions
+        if kw.iscxr(HEAD): return kw.evcxr(HEAD[1:-1], evaluate(expr[1]))
 
-                # Create new template instances
-                case "new" : return cf.config.ENV.lookup(TAIL[0]).new(*TAIL[1:]) 
+        # Special forms and functions with unique evaluation requirements
+        match HEAD:
 
-                # Evaluate 'until' expressions
-                case "until": return kw.until(expr[1][0], expr[1][1], expr[2])
+            # Create new template instances
+            case "new" : return cf.config.ENV.lookup(TAIL[0]).new(*TAIL[1:]) 
 
-                # Lambda function declarations
-                case "lambda": return dt.Function("lambda", expr[1], expr[2])
+            # Evaluate 'until' expressions
+            case "until": return kw.until(expr[1][0], expr[1][1], expr[2])
 
-                # 'string' and 'list' predicates
-                case "string?": return kw.isstring(TAIL)
-                case "list?":  return kw.islist(TAIL)
+            # Lambda function declarations
+            case "lambda": return dt.Function("lambda", expr[1], expr[2])
 
-                # Evaluate conditionals
-                case "cond": return kw.cond(TAIL)
+            # 'string' and 'list' predicates
+            case "string?": return kw.isstring(TAIL)
+            case "list?":  return kw.islist(TAIL)
 
-                # Evaluate 'quote' expressions
-                case _: return expr[1]
-        
-        # Otherwise head is a literal
-        return kw.evlist(expr)
+            # Evaluate conditionals
+            case "cond": return kw.cond(TAIL)
+
+            # Evaluate 'quote' expressions
+            case _: return expr[1]
 
     # Otherwise head is a list
     evaluated = [evaluate(expr[0]), *expr[1:]]; return expr if expr == evaluated else evaluate(evaluated)
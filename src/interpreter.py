@@ -105,7 +105,7 @@ https://github.com/Antonio-Iijima/OPAL
         print()
         if cf.config.CLOSURES:
             for entry, env in cf.config.CLOSURES.items():
-                print(f"{entry}:\n{env}")  
+                print(f"ID:{entry}:\n{env}")  
         else: print("No function environments found.")
         print()
               
@@ -255,6 +255,8 @@ https://github.com/Antonio-Iijima/OPAL
             cf.config.EXTENSION_LOG.insert(index, (alias))
             cf.config.EXTENSION_INDEX.insert(index, (alias, len(extension.splitlines())))
             cf.config.KEYWORDS["EXTENSIONS"][alias] = ext.EXTENSIONS.get(name)
+
+        cf.config.refresh_keywords()
             
 
     def exit_extensions(self) -> None:
@@ -288,6 +290,7 @@ https://github.com/Antonio-Iijima/OPAL
             item = random.choice(list(category))
 
             category.discard(item) if isinstance(category, set) else category.pop(item)
+            cf.config.refresh_keywords()
                              
             print(f"You just lost the '{item}' function. Number of keywords remaining: {cf.config.current_keyword_num()}")
 
@@ -4,12 +4,26 @@
 
 import re
 import importlib
+import operator as op
 
 import repl as rpl
 import config as cf
 import parser as prs
 import evaluate as ev
 import datatypes as dt
+import compiler as cp
+
+
+
+##### Constants #####
+
+
+
+# Compiled once at import; the predicates below run on nearly every atom
+_IMPORT_RE = re.compile(r"^[A-Za-z]+\.[A-Za-z]+$")
+
+# Marks omitted arguments where None or other falsy values are meaningful
+_MISSING = object()
 
 
 
@@ -32,17 +46,25 @@ def isvariable(x: str) -> bool:
     
 def iskeyword(x: str) -> bool: 
     """Unary `keyword` predicate."""
-    return any(x in category for category in cf.config.KEYWORDS.values()) or iscxr(x)
+    return x in cf.config.KEYWORD_SET or iscxr(x)
 
 
 def isimport(x: str) -> bool:
     """Unary `import` predicate."""
-    return bool(re.match(r"^[a-z, A-Z]*[.][a-z, A-Z]+$", str(x)))
+    return isinstance(x, str) and bool(_IMPORT_RE.match(x))
 
 
 def isnumber(x: str | int | float) -> bool: 
     """Unary `int` or `float` predicate."""
-    return bool(re.match(r"^[-]?[0-9]*[.]?[0-9]+$", str(x)))
+    if isinstance(x, (int, float)): return not isinstance(x, bool)
+    elif not isinstance(x, str): return False
+
+    # Plain string tests are cheaper than the regex engine; equivalent to ^-?[0-9]*\.?[0-9]+$
+    number = x.removeprefix("-")
+    whole, dot, fraction = number.partition(".")
+    if not dot: whole, fraction = "", whole
+
+    return number.isascii() and fraction.isdigit() and (not whole or whole.isdigit())
 
 
 def isfunction(x: dt.Function) -> bool: 
@@ -57,7 +79,7 @@ def istemplate(x: dt.Template | dt.Instance) -> bool:
 
 def iscxr(x: str) -> bool:
     """Unary `car` and `cdr` predicate, generalized to include all abbreviated forms."""
-    return bool(re.match(r"^c[ad]+r$", str(x)))
+    return isinstance(x, str) and len(x) > 2 and x[0] == "c" and x[-1] == "r" and not x[1:-1].strip("ad")
 
 
 def isatom(x: any) -> bool:
@@ -126,7 +148,10 @@ def setref(l: list, i: int, item: any) -> None:
 
 def evlist(x: list) -> list:
     """Evaluates each element in the input list and returns them as a list."""
-    return [*map(ev.evaluate, x)]
+
+    # Bind the evaluator once per call rather than once per element
+    evaluate = ev.evaluate
+    return [evaluate(e) for e in x]
 
 
 def head(x: list) -> any:
@@ -135,18 +160,25 @@ def head(x: list) -> any:
     except: raise TypeError(f"unsupported argument for 'car': {prs.convert(x)}")
 
 
-def tail(x: list) -> list:
-    """Returns the tail of a list or raises a TypeError."""
-    try: return x[1:]
+def tail(x: list, n: int = 1) -> list:
+    """Returns the tail of a list, optionally dropping `n` elements at once, or raises a TypeError."""
+    try: return x[n:]
     except: raise TypeError(f"unsupported argument for 'cdr': {prs.convert(x)}")
     
 
 def evcxr(x: str, output: any) -> any:
-    """Tail-recursive evaluation of `cxr` expressions (arbitrary combinations of `car` and `cdr`)."""
+    """Iterative evaluation of `cxr` expressions (arbitrary combinations of `car` and `cdr`)."""
+
+    # Number of consecutive `cdr` operations not yet applied
+    drop = 0
+
+    # Operations are applied innermost first, i.e. from right to left;
+    # runs of `cdr` are collapsed into a single slice rather than copying the list once per `d`
+    for letter in reversed(x):
+        if letter == "d": drop += 1
+        else: output = head(tail(output, drop) if drop else output); drop = 0
 
-    if not x: return output
-    elif x.endswith("a"): return evcxr(x.removesuffix("a"), head(output))
-    elif x.endswith("d"): return evcxr(x.removesuffix("d"), tail(output))
+    return tail(output, drop) if drop else output
 
 
 def rebool(x: str | bool) -> bool:
@@ -165,25 +197,34 @@ def lst(*x: str | int | bool) -> list:
 def cond(expr: list) -> any:
     """Evaluate conditional expression."""
     
-    # Evaluate the body of the conditional if the condition is true or 'else', otherwise move to next conditional
-    return ev.evaluate(expr[0][1]) if (expr[0][0] == "else" or ev.evaluate(expr[0][0])) else cond(expr[1:])
+    evaluate = ev.evaluate
+
+    # Evaluate the body of the first conditional whose condition is true or 'else'
+    for clause in expr:
+        if clause[0] == "else" or evaluate(clause[0]): return evaluate(clause[1])
 
 
 def repeat(number: int, body: list) -> None:
     """Evaluate `body` `number` times."""
     
-    n = ev.evaluate(number)
+    n, evaluate = ev.evaluate(number), ev.evaluate
+
     for _ in range(n):
-        ev.evaluate(body)
+        evaluate(body)
 
 
 def until(cond: list | bool, inc: list, body: list) -> None:
     """Repeatedly evaluate.evaluate `body` until `cond` is `#f`. Runs in a local scope."""
 
     def logic(cond: list | bool, inc: int, body: list) -> None:
-        while not(ev.evaluate(cond)):
-            ev.evaluate(body)
-            ev.evaluate(inc)
+
+        # Numeric conditions are compiled once rather than re-interpreted every iteration;
+        # the body and increment only matter for their side effects, which numeric code cannot have
+        cond, evaluate = cp.compiled(cond), ev.evaluate
+
+        while not(cond()):
+            evaluate(body)
+            evaluate(inc)
 
     return cf.config.ENV.runlocal(logic, cond, inc, body)
 
@@ -192,7 +233,8 @@ def let(bindings: list, body: list) -> any:
     """Binds all variables in `bindings` and evaluates `body` in a local scope."""
 
     def logic(bindings: list, body: list) -> any:
-        for pair in bindings: cf.config.ENV.set(*pair)
+        env = cf.config.ENV
+        for pair in bindings: env.set(*pair)
         return ev.evaluate(body)
     
     return cf.config.ENV.runlocal(logic, bindings, body)
@@ -202,8 +244,9 @@ def do(exprlist: list, body: list) -> any:
     """Evaluates a series of expressions before returning the value of `body`. Runs in a local scope."""
     
     def logic(exprlist: list, body: list) -> any:
-        for expr in exprlist: ev.evaluate(expr)
-        return ev.evaluate(body)
+        evaluate = ev.evaluate
+        for expr in exprlist: evaluate(expr)
+        return evaluate(body)
     
     return cf.config.ENV.runlocal(logic, exprlist, body)
 
@@ -247,34 +290,24 @@ def run_method(imported: str, args: list) -> any:
     return imported(*args) if callable(imported) else imported
 
 
-def globals(var: str, val: any = None) -> None:
+def globals(var: str, val: any = _MISSING) -> None:
     """Define or access global variables."""
 
     # If val is provided, evaluate and assign it to var in the GLOBALS dictionary
-    if val: cf.config.GLOBALS[var] = ev.evaluate(val)
+    if val is not _MISSING: cf.config.GLOBALS[var] = ev.evaluate(val); return
 
     # Otherwise look up and return the value of var if it exists
-    else: return cf.config.GLOBALS.get(var, ValueError)
+    value = cf.config.GLOBALS.get(var, _MISSING)
+    if value is _MISSING: raise ValueError(f"global variable {var} is not defined.")
+
+    return value
 
 
 ## Wrappers or slight extensions for basic Python functions
 ## Simplicity obviates the need for detailed comments or type annotation
 
 
-# Mathematical functions
-def eq(x, y)       : return x == y
-def uneq(x, y)     : return x != y
-def exponent(x, y) : return x ** y
-def leq(x, y)      : return x <= y
-def geq(x, y)      : return x >= y
-def i_divide(x, y) : return x // y
-def less(x, y)     : return x < y
-def greater(x, y)  : return x > y
-def multiply(x, y) : return x * y
-def f_divide(x, y) : return x / y
-def add(x, y)      : return x + y
-def subtract(x, y) : return x - y
-def mod(x, y)      : return x % y
+# Mathematical functions; binary operators use their C implementations from the operator module
 def increment(x)   : return x + 1
 
 # Boolean logic functions
@@ -294,15 +327,15 @@ def NAND(a, b) : return not (a and b)
 # Common applicative-order functions 
 REGULAR = {
     "len"     : len,        "sort"  : sorted,
-    "show"    : show,       "eq"    : eq,
-    "+"       : add,        "-"     : subtract,
-    "*"       : multiply,   "/"     : f_divide,
-    "**"      : exponent,   "//"    : i_divide,
-    ">"       : greater,    "<"     : less,    
-    ">="      : geq,        "<="    : leq,
-    "!="      : uneq,       "%"     : mod,
+    "show"    : show,       "eq"    : op.eq,
+    "+"       : op.add,     "-"     : op.sub,
+    "*"       : op.mul,     "/"     : op.truediv,
+    "**"      : op.pow,     "//"    : op.floordiv,
+    ">"       : op.gt,      "<"     : op.lt,    
+    ">="      : op.ge,      "<="    : op.le,
+    "!="      : op.ne,      "%"     : op.mod,
     "append"  : append,     "elem"  : elem,
-    "=="      : eq,         "ref"   : ref,
+    "=="      : op.eq,      "ref"   : ref,
     "null?"   : isnull,     "atom?" : isatom,
     "number?" : isnumber,   "cons"  : cons,
     "setref"  : setref,     "++"    : increment,
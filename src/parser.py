@@ -2,8 +2,12 @@
 
 
 
+import re
+import sys
+
 import config as cf
 import keywords as kw
+import datatypes as dt
 
 
 
@@ -11,6 +15,14 @@ import keywords as kw
 
 
 
+# Parentheses and quotes are tokens on their own; anything else runs until whitespace or one of those
+_TOKEN_RE = re.compile(r"[()']|[^\s()']+")
+
+# Previously retyped tokens, so that repeated literals and identifiers share a single object
+RETYPE_CACHE = {}
+RETYPE_CACHE_SIZE = 2**16
+
+
 ## Basic syntax checking (parentheses, operators, etc.) and typing
 
 
@@ -28,88 +40,73 @@ def iscomplete(expr: str) -> bool:
     return all(ext in expr for ext in ("@start", "@end")) or ("@start" not in expr and expr.count("(") == expr.count(")"))
 
 
-def isperfectlybalanced(expr: list) -> bool: 
-    """Check for balanced parentheses in an OPAL expression."""
-    
-    stack = 0
-
-    for char in expr:
-        if char == "(": stack += 1
-        elif char == ")": 
-            if not stack: raise SyntaxError(f"unmatched closing parenthesis in {" ".join(expr)}")
-            else: stack -= 1
-    
-    if stack: raise SyntaxError(f"unmatched opening parenthesis in {" ".join(expr)}")
-
-
-def syntax_check(expr: list) -> list:
-    """Checks balanced parentheses, proper expression nesting, etc. Raises errors if any conditions not met, otherwise returns `expr`."""
-
-    isperfectlybalanced(expr)        
-
-    return expr
-
+def retype(x: str) -> int | float | bool: 
+    """Replace int, float, and bool strings with their correct data types. Results are cached by token."""
 
-def get_opp_par(expr: list) -> int | bool:
-    """Get the index of the corresponding parenthesis, otherwise return False."""
+    if x in RETYPE_CACHE:
+        value = RETYPE_CACHE[x]
 
-    balance = 0
+        # Keywords are only reused while their dispatch entry is current
+        if type(value) is not dt.Keyword or cf.config.DISPATCH.get(x) is value.entry: return value
 
-    for index, char in enumerate(expr):
-        if   char == "(": balance += 1
-        elif char == ")": balance -= 1
+    if kw.isnumber(x): value = float(x) if "." in x else int(x)
+    elif x in ("#t", "#f"): value = x == "#t"
 
-        if balance == 0: return index
+    # Tag keywords with their dispatch entry so the evaluator need not classify them again
+    elif x in cf.config.DISPATCH: value = dt.Keyword(x, cf.config.DISPATCH[x])
 
+    # Intern identifiers so that comparisons between them are mostly pointer comparisons
+    else: value = sys.intern(x)
 
-def retype(x: str) -> int | float | bool: 
-    """Replace int, float, and bool strings with their correct data types."""
+    if x in RETYPE_CACHE or len(RETYPE_CACHE) < RETYPE_CACHE_SIZE: RETYPE_CACHE[x] = value
 
-    if kw.isnumber(x): return float(x) if "." in x else int(x)
-    elif x in ("#t", "#f"): return x == "#t"
-    return x
+    return value
 
 
 ## Low-level syntax conversion
 
 
 def OPAL_to_list(s: str) -> list: 
-    """Divide OPAL expression into intermediary list of strings."""
-    return s.replace("(", " ( ").replace(")", " ) ").replace("'", " ' ").split()
+    """Divide OPAL expression into intermediary list of strings in a single scan."""
+    return _TOKEN_RE.findall(s)
 
 
 def lst_to_Python(expr: list) -> list:
-    """Convert intermediary list of strings into nested lists."""
+    """Convert intermediary list of strings into nested lists in a single pass, checking balanced parentheses, expanding ' abbreviations and replacing special data types."""
 
-    if expr == []: return []
-    elif expr[0] == "(": 
-        closing_idx = get_opp_par(expr)
+    # Stack of open expressions, each paired with the number of quotes applied to it
+    stack, quotes = [([], 0)], 0
 
-        # Replace the section from opening to closing with a list, process the contents, process the rest, and return
-        return [lst_to_Python(expr[1:closing_idx]), *lst_to_Python(expr[closing_idx+1:])]
-    
-    # Otherwise leave as is and process the rest
-    return [expr[0], *lst_to_Python(expr[1:])]
+    for token in expr:
+
+        # Quotes apply to the next complete item
+        if token == "'": quotes += 1; continue
+
+        # Open a new expression, carrying over any pending quotes
+        elif token == "(": stack.append(([], quotes)); quotes = 0; continue
 
+        elif token == ")":
+            if len(stack) == 1: raise SyntaxError(f"unmatched closing parenthesis in {" ".join(expr)}")
+            elif quotes: raise SyntaxError(f"missing quoted expression in {" ".join(expr)}")
+            item, quotes = stack.pop()
 
-def preprocess(expr: list) -> list:
-    """Replace all special data types."""
+            # Resolve calls to regular functions with two arguments ahead of evaluation
+            if len(item) == 3 and isinstance(item[0], str):
+                entry = cf.config.DISPATCH.get(item[0])
+                if entry and entry[0] == "REGULAR": item = dt.BinaryCall(item, entry)
+
+        # Otherwise replace with correct data type; quoted atoms are left as is
+        else: item = sys.intern(token) if quotes else retype(token)
 
-    # Filter only expressions
-    if isinstance(expr, list):
-        if expr == []: return []
-        
-        # Process the head and the tail
-        elif isinstance(expr[0], list): return [preprocess(expr[0]), *preprocess(expr[1:])]
-        
         # Expand ' abbreviation to full (quote x) expressions
-        elif expr[0] == "'": return [["quote", preprocess(expr[1])], *preprocess(expr[2:])]
+        for _ in range(quotes): item = ["quote", item]
+
+        stack[-1][0].append(item); quotes = 0
 
-        # Otherwise replace with correct data type
-        return [retype(expr[0]), *preprocess(expr[1:])]
+    if len(stack) > 1: raise SyntaxError(f"unmatched opening parenthesis in {" ".join(expr)}")
+    elif quotes: raise SyntaxError(f"missing quoted expression in {" ".join(expr)}")
 
-    # Otherwise return original input atom
-    return expr
+    return stack[0][0]
 
 
 
@@ -120,13 +117,37 @@ def preprocess(expr: list) -> list:
 def convert(s: any) -> str | None:
     """Convert Python list to fully-parenthesized OPAL string."""
 
-    if s == None: return None
-    elif isinstance(s, bool): return "#t" if s else "#f"
+    if s is None: return None
+
+    # Output is collected in a buffer and joined once; the stack holds items still to be written,
+    # each paired with whether it is literal text rather than an expression to convert
+    buffer, stack = [], [(s, False)]
+
+    while stack:
+        item, text = stack.pop()
+
+        if text: buffer.append(item)
+        elif item is None: buffer.append("None")
+        elif isinstance(item, bool): buffer.append("#t" if item else "#f")
+
+        # Replace (quote x) with '
+        elif kw.isquote(item): buffer.append("'"); stack.append((item[1], False))
+
+        # Replace lists with parentheses, leaving out None elements
+        elif isinstance(item, list):
+            buffer.append("(")
+            stack.append((")", True))
+
+            elements = [elem for elem in item if elem is not None]
+            for index in reversed(range(len(elements))):
+                stack.append((elements[index], False))
+                if index: stack.append((" ", True))
+
+        else: buffer.append(str(item))
 
-    # Otherwise replace lists with parentheses and (quote x) with '
-    return f"'{convert(s[1])}" if kw.isquote(s) else f"({' '.join(convert(elem) for elem in s if elem != None)})" if isinstance(s, list) else str(s)
+    return "".join(buffer)
 
 
 def parse(s: str) -> list: 
     """Perform syntax checking and convert OPAL expression string to manipulable Python lists."""
-    return preprocess(lst_to_Python(syntax_check(OPAL_to_list(s)))).pop()
+    return lst_to_Python(OPAL_to_list(s)).pop()